@@ -8,7 +8,7 @@ __author__ = "Relay Coordination Team"
 
 # Core classes
 from relay_coordination.core.ct import CT
-from relay_coordination.core.relay import Relay
+from relay_coordination.core.relay import Relay, RelayFleet
 from relay_coordination.core.cb import CircuitBreaker
 
 # Helper functions for adding devices
@@ -16,16 +16,29 @@ from relay_coordination.core.ct import add_ct
 from relay_coordination.core.relay import add_relay
 from relay_coordination.core.cb import add_cb
 
-# Analysis functions
-from relay_coordination.analysis.coordination import run_coordination_analysis
-from relay_coordination.analysis.short_circuit import run_sc_analysis
-from relay_coordination.analysis.reports import (
-    print_protection_summary,
-    export_coordination_table
-)
+# Analysis and plotting functions are imported on first access (PEP 562), so
+# that using the core classes does not load pandas, pandapower or matplotlib
+_LAZY_ATTRS = {
+    'run_coordination_analysis': 'relay_coordination.analysis.coordination',
+    'run_sc_analysis': 'relay_coordination.analysis.short_circuit',
+    'print_protection_summary': 'relay_coordination.analysis.reports',
+    'export_coordination_table': 'relay_coordination.analysis.reports',
+    'plot_tcc_curves': 'relay_coordination.plotting.tcc',
+    'generate_coordination_table': 'relay_coordination.plotting.tcc',
+}
 
-# Plotting functions
-from relay_coordination.plotting.tcc import plot_tcc_curves, generate_coordination_table
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Version
@@ -34,6 +47,7 @@ __all__ = [
     # Core classes
     'CT',
     'Relay',
+    'RelayFleet',
     'CircuitBreaker',
     
     # Helper functions
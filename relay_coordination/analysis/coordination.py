@@ -2,9 +2,11 @@
 Coordination Analysis Module
 Simplified API for protection coordination testing with automatic reporting
 """
-import pandas as pd
+import numpy as np
 from typing import List, Optional
-from relay_coordination.analysis.reports import export_coordination_table
+from relay_coordination.analysis.reports import (export_coordination_table, _coordination_csv_columns,
+                                                 _format_times, _write_coordination_csv)
+from relay_coordination.core.relay import _trip_time_matrix
 
 
 def run_coordination_analysis(net, 
@@ -30,10 +32,11 @@ def run_coordination_analysis(net,
     --------
     pd.DataFrame - Coordination table
     """
+    import pandas as pd
+    
     if export_csv:
         import os
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
     if test_currents is None:
         test_currents = [100, 200, 500, 1000, 2000, 5000]
@@ -47,79 +50,43 @@ def run_coordination_analysis(net,
     print("="*80)
     
     relays = net.protection['relay']
-    
-    # Generate coordination data
-    data = []
-    for I_fault in test_currents:
-        row = {'Fault Current (A)': I_fault}
-        
-        for relay in relays:
-            trip_time = relay.calculate_trip_time(I_fault, fault_type)
-            
-            if trip_time is not None:
-                # Determine which element operated
-                if fault_type == "phase":
-                    if relay.phase_inst_enabled and relay.phase_inst_pickup and I_fault >= relay.phase_inst_pickup:
-                        element = "50"
-                    else:
-                        element = "51"
-                else:  # ground
-                    if relay.ground_inst_enabled and relay.ground_inst_pickup and I_fault >= relay.ground_inst_pickup:
-                        element = "50N"
-                    else:
-                        element = "51N"
-                
-                # Add CB total time if available
-                if relay.cb:
-                    total_time = relay.cb.total_clearing_time(I_fault, fault_type)
-                    row[f"{relay.name} Relay (s)"] = f"{trip_time:.4f} ({element})"
-                    row[f"{relay.name} Total (s)"] = f"{total_time:.4f}"
-                else:
-                    row[f"{relay.name} (s)"] = f"{trip_time:.4f} ({element})"
-            else:
-                if relay.cb:
-                    row[f"{relay.name} Relay (s)"] = "No trip"
-                    row[f"{relay.name} Total (s)"] = "No trip"
-                else:
-                    row[f"{relay.name} (s)"] = "No trip"
+    I_arr = np.asarray(test_currents, dtype=float)
+    
+    # Generate coordination data: one sweep over all relays, shared by the
+    # printed table and the CSV export
+    trip_matrix = _trip_time_matrix(relays, I_arr, fault_type)
+    csv_columns = _coordination_csv_columns(relays, test_currents, trip_matrix)
+    columns = {key: times if key == 'Fault Current (A)' else _format_times(times)
+               for key, times in csv_columns.items()}
+    for relay, trip_times in zip(relays, trip_matrix):
+        # Determine which element operated
+        if fault_type == "phase":
+            inst_enabled, inst_pickup, labels = relay.phase_inst_enabled, relay.phase_inst_pickup, ("50", "51")
+        else:  # ground
+            inst_enabled, inst_pickup, labels = relay.ground_inst_enabled, relay.ground_inst_pickup, ("50N", "51N")
+        if inst_enabled and inst_pickup:
+            inst_mask = I_arr >= inst_pickup
+        else:
+            inst_mask = np.zeros(I_arr.shape, dtype=bool)
+        elements = np.where(inst_mask, f" ({labels[0]})", f" ({labels[1]})")
         
-        data.append(row)
+        # Display the relay time with the operating element
+        key = f"{relay.name} Relay (s)" if relay.cb else f"{relay.name} (s)"
+        relay_times = columns[key]
+        columns[key] = np.where(np.isnan(trip_times), relay_times, np.char.add(relay_times, elements))
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(columns)
     
     # Print formatted table
     print(f"\nCoordination Table:")
     print(df.to_string(index=False))
     
-    # Export to CSV
+    # Export to CSV (clean version without element labels)
     if export_csv:
         import os
         filename = os.path.join(output_dir, f'coordination_table_{fault_type}.csv')
-        
-        # Create clean version for CSV (remove element labels)
-        csv_data = []
-        for I_fault in test_currents:
-            row = {'Fault Current (A)': I_fault}
-            for relay in relays:
-                trip_time = relay.calculate_trip_time(I_fault, fault_type)
-                if trip_time is not None:
-                    if relay.cb:
-                        total_time = relay.cb.total_clearing_time(I_fault, fault_type)
-                        row[f"{relay.name} Relay (s)"] = f"{trip_time:.4f}"
-                        row[f"{relay.name} Total (s)"] = f"{total_time:.4f}"
-                    else:
-                        row[f"{relay.name} (s)"] = f"{trip_time:.4f}"
-                else:
-                    if relay.cb:
-                        row[f"{relay.name} Relay (s)"] = "No trip"
-                        row[f"{relay.name} Total (s)"] = "No trip"
-                    else:
-                        row[f"{relay.name} (s)"] = "No trip"
-            csv_data.append(row)
-        
-        csv_df = pd.DataFrame(csv_data)
-        csv_df.to_csv(filename, index=False)
+        _write_coordination_csv(csv_columns, filename)
         print(f"\n✓ Coordination table exported to {filename}")
     
     return df
@@ -154,20 +121,24 @@ def check_selectivity(net, fault_current: float, fault_type: str = "phase", min_
     # Sort by trip time
     trip_times.sort(key=lambda x: x[1])
     
-    print(f"\nSelectivity Check at {fault_current}A ({fault_type}):")
-    print(f"{'Relay':<15} {'Trip Time (s)':<15} {'Margin (s)':<15} {'Status':<10}")
-    print("-" * 60)
+    lines = [
+        f"\nSelectivity Check at {fault_current}A ({fault_type}):",
+        f"{'Relay':<15} {'Trip Time (s)':<15} {'Margin (s)':<15} {'Status':<10}",
+        "-" * 60,
+    ]
     
     results = []
     for i, (relay_name, trip_time) in enumerate(trip_times):
         if i == 0:
-            print(f"{relay_name:<15} {trip_time:<15.4f} {'N/A':<15} {'Primary':<10}")
+            lines.append(f"{relay_name:<15} {trip_time:<15.4f} {'N/A':<15} {'Primary':<10}")
             results.append({'relay': relay_name, 'trip_time': trip_time, 'margin': None, 'selective': True})
         else:
             margin = trip_time - trip_times[i-1][1]
             selective = margin >= min_margin
             status = '✓ OK' if selective else '✗ FAIL'
-            print(f"{relay_name:<15} {trip_time:<15.4f} {margin:<15.4f} {status:<10}")
+            lines.append(f"{relay_name:<15} {trip_time:<15.4f} {margin:<15.4f} {status:<10}")
             results.append({'relay': relay_name, 'trip_time': trip_time, 'margin': margin, 'selective': selective})
     
+    print("\n".join(lines))
+    
     return results
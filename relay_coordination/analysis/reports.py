@@ -2,8 +2,69 @@
 Reporting Functions
 Automated report generation and CSV export for protection studies
 """
-import pandas as pd
+import numpy as np
 from typing import List, Optional
+from relay_coordination.core.relay import _trip_time_matrix
+
+
+def _sc_rows(net, buses) -> np.ndarray:
+    """Row positions of the given buses in net.res_bus_sc (-1 where a bus has no result)"""
+    return net.res_bus_sc.index.get_indexer(buses)
+
+
+# to_csv options for trip time tables: 4 decimals, "No trip" where NaN
+_CSV_FORMAT = {'float_format': '%.4f', 'na_rep': 'No trip'}
+
+
+def _write_coordination_csv(columns: dict, filename: str):
+    """Write _coordination_csv_columns to CSV, formatting only the trip time columns"""
+    import pandas as pd
+    
+    df = pd.DataFrame(columns)
+    # Echo the test currents as given: object dtype is left alone by float_format
+    df['Fault Current (A)'] = df['Fault Current (A)'].astype(object)
+    df.to_csv(filename, index=False, **_CSV_FORMAT)
+
+
+def _format_times(times: np.ndarray) -> np.ndarray:
+    """Format trip times with 4 decimals, "No trip" where NaN"""
+    return np.where(np.isnan(times), "No trip", np.char.mod("%.4f", times))
+
+
+def _coordination_csv_columns(relays, test_currents, trip_matrix: np.ndarray) -> dict:
+    """
+    Columns of the exported coordination table
+    
+    Relay trip times and, for relays with a CB, total clearing times derived
+    from the same trip times (no second relay evaluation). Times are raw
+    floats, NaN where a relay doesn't trip; formatting is left to
+    _write_coordination_csv or _format_times for display.
+    """
+    columns = {'Fault Current (A)': test_currents}
+    for relay, trip_times in zip(relays, trip_matrix):
+        if relay.cb:
+            columns[f"{relay.name} Relay (s)"] = trip_times
+            columns[f"{relay.name} Total (s)"] = relay.cb.add_operating(trip_times)
+        else:
+            columns[f"{relay.name} (s)"] = trip_times
+    return columns
+
+
+def _cb_table(net) -> "pd.DataFrame":
+    """Breaker name, bus and symmetrical interrupting rating of every CB, one row per breaker"""
+    import pandas as pd
+    
+    cbs = net.protection['cb']
+    return pd.DataFrame({
+        'name': [cb.name for cb in cbs],
+        'bus': [cb.bus for cb in cbs],
+        'interrupting_rating_ka_sym': np.array([cb.interrupting_rating_ka_sym for cb in cbs], dtype=float),
+    })
+
+
+def _bus_names(net, buses) -> np.ndarray:
+    """Names of the given buses, gathered in one lookup"""
+    return net.bus['name'].reindex(buses).to_numpy()
 
 
 def print_protection_summary(net):
@@ -22,25 +83,26 @@ def print_protection_summary(net):
     num_relays = len(net.protection.get('relay', []))
     num_cbs = len(net.protection.get('cb', []))
     
-    print("\n" + "="*80)
-    print("PROTECTION SYSTEM SUMMARY")
-    print("="*80)
-    print(f"\nNetwork has {num_cts} CTs, {num_relays} Relays, {num_cbs} CBs")
+    lines = [
+        "\n" + "="*80,
+        "PROTECTION SYSTEM SUMMARY",
+        "="*80,
+        f"\nNetwork has {num_cts} CTs, {num_relays} Relays, {num_cbs} CBs",
+    ]
     
     if num_cts > 0:
-        print("\nCurrent Transformers:")
-        for ct in net.protection['ct']:
-            print(f"  {ct}")
+        lines.append("\nCurrent Transformers:")
+        lines.extend(f"  {ct}" for ct in net.protection['ct'])
     
     if num_relays > 0:
-        print("\nProtection Relays:")
-        for relay in net.protection['relay']:
-            print(f"  {relay}")
+        lines.append("\nProtection Relays:")
+        lines.extend(f"  {relay}" for relay in net.protection['relay'])
     
     if num_cbs > 0:
-        print("\nCircuit Breakers:")
-        for cb in net.protection['cb']:
-            print(f"  {cb}")
+        lines.append("\nCircuit Breakers:")
+        lines.extend(f"  {cb}" for cb in net.protection['cb'])
+    
+    print("\n".join(lines))
 
 
 def export_coordination_table(net, filename: str, test_currents: List[float], fault_type: str = "phase"):
@@ -59,33 +121,9 @@ def export_coordination_table(net, filename: str, test_currents: List[float], fa
         return
     
     relays = net.protection['relay']
+    trip_matrix = _trip_time_matrix(relays, np.asarray(test_currents, dtype=float), fault_type)
     
-    data = []
-    for I_fault in test_currents:
-        row = {'Fault Current (A)': I_fault}
-        
-        for relay in relays:
-            trip_time = relay.calculate_trip_time(I_fault, fault_type)
-            
-            if trip_time is not None:
-                # Add CB operating time if available
-                if relay.cb:
-                    total_time = relay.cb.total_clearing_time(I_fault, fault_type)
-                    row[f"{relay.name} Relay (s)"] = f"{trip_time:.4f}"
-                    row[f"{relay.name} Total (s)"] = f"{total_time:.4f}"
-                else:
-                    row[f"{relay.name} (s)"] = f"{trip_time:.4f}"
-            else:
-                if relay.cb:
-                    row[f"{relay.name} Relay (s)"] = "No trip"
-                    row[f"{relay.name} Total (s)"] = "No trip"
-                else:
-                    row[f"{relay.name} (s)"] = "No trip"
-        
-        data.append(row)
-    
-    df = pd.DataFrame(data)
-    df.to_csv(filename, index=False)
+    _write_coordination_csv(_coordination_csv_columns(relays, test_currents, trip_matrix), filename)
     print(f"✓ Coordination table exported to {filename}")
 
 
@@ -116,6 +154,8 @@ def export_breaker_adequacy(net, filename: str):
     net : pandapower network
     filename : str - Output CSV filename
     """
+    import pandas as pd
+    
     if not hasattr(net, 'protection') or 'cb' not in net.protection:
         print("No circuit breakers found in network")
         return
@@ -124,22 +164,18 @@ def export_breaker_adequacy(net, filename: str):
         print("No short circuit results found. Run short circuit analysis first.")
         return
     
-    data = []
-    for cb in net.protection['cb']:
-        bus_idx = cb.bus
-        if bus_idx < len(net.res_bus_sc):
-            ikss = net.res_bus_sc.at[bus_idx, 'ikss_ka']
-            adequate = ikss <= cb.interrupting_rating_ka_sym
-            
-            data.append({
-                'CB Name': cb.name,
-                'Bus': net.bus.at[bus_idx, 'name'],
-                'Fault Current (kA)': f"{ikss:.2f}",
-                'CB Rating (kA)': f"{cb.interrupting_rating_ka_sym:.2f}",
-                'Adequate': 'Yes' if adequate else 'No'
-            })
-    
-    df = pd.DataFrame(data)
+    # Join the breaker table with the fault current at each breaker's bus
+    cb_table = _cb_table(net).merge(net.res_bus_sc[['ikss_ka']], left_on='bus', right_index=True)
+    cb_table = cb_table.merge(net.bus[['name']].rename(columns={'name': 'bus_name'}), left_on='bus', right_index=True)
+    adequate = cb_table['ikss_ka'] <= cb_table['interrupting_rating_ka_sym']
+    
+    df = pd.DataFrame({
+        'CB Name': cb_table['name'],
+        'Bus': cb_table['bus_name'],
+        'Fault Current (kA)': cb_table['ikss_ka'].map('{:.2f}'.format),
+        'CB Rating (kA)': cb_table['interrupting_rating_ka_sym'].map('{:.2f}'.format),
+        'Adequate': np.where(adequate, 'Yes', 'No')
+    })
     df.to_csv(filename, index=False)
     print(f"✓ Breaker adequacy report exported to {filename}")
 
@@ -153,6 +189,8 @@ def export_ct_adequacy(net, filename: str):
     net : pandapower network
     filename : str - Output CSV filename
     """
+    import pandas as pd
+    
     if not hasattr(net, 'protection') or 'ct' not in net.protection:
         print("No CTs found in network")
         return
@@ -161,11 +199,15 @@ def export_ct_adequacy(net, filename: str):
         print("No short circuit results found. Run short circuit analysis first.")
         return
     
+    cts = net.protection['ct']
+    buses = [ct.bus for ct in cts]
+    rows = _sc_rows(net, buses)
+    fault_ka = net.res_bus_sc['ikss_ka'].to_numpy()[rows]
+    bus_names = _bus_names(net, buses)
+    
     data = []
-    for ct in net.protection['ct']:
-        bus_idx = ct.bus
-        if bus_idx < len(net.res_bus_sc):
-            ikss_ka = net.res_bus_sc.at[bus_idx, 'ikss_ka']
+    for ct, row, ikss_ka, bus_name in zip(cts, rows, fault_ka, bus_names):
+        if row >= 0:
             i_primary = ikss_ka * 1000.0
             
             # Simple saturation check
@@ -176,7 +218,7 @@ def export_ct_adequacy(net, filename: str):
             
             data.append({
                 'CT Name': ct.name,
-                'Bus': net.bus.at[bus_idx, 'name'],
+                'Bus': bus_name,
                 'Fault Current (kA)': f"{ikss_ka:.2f}",
                 'CT Ratio': f"{ct.primary_rating}/{ct.secondary_rating}",
                 'Accuracy Class': ct.accuracy_class_iec,
@@ -2,11 +2,26 @@
 Short Circuit Analysis Module
 Simplified API for IEC 60909 short circuit analysis with automatic reporting
 """
-import pandas as pd
 from typing import Optional
 
 
-def run_sc_analysis(net, export_csv: bool = True, check_breakers: bool = True, output_dir: str = 'data'):
+# Network tables the IEC 60909 result depends on (topology, impedances and sources)
+_SC_TABLES = ('bus', 'line', 'trafo', 'trafo3w', 'impedance', 'switch',
+              'ext_grid', 'gen', 'sgen', 'motor', 'storage', 'shunt', 'ward', 'xward')
+
+
+def _sc_cache_key(net) -> int:
+    """Cheap fingerprint of the network tables used by the short circuit calculation"""
+    import pandas as pd
+    
+    return hash(tuple(
+        (table, tuple(net[table].columns), int(pd.util.hash_pandas_object(net[table]).sum()))
+        for table in _SC_TABLES if table in net
+    ))
+
+
+def run_sc_analysis(net, export_csv: bool = True, check_breakers: bool = True, output_dir: str = 'data',
+                    force: bool = False):
     """
     Run short circuit analysis with automatic reporting (similar to pp.runpp())
     
@@ -19,58 +34,79 @@ def run_sc_analysis(net, export_csv: bool = True, check_breakers: bool = True, o
     export_csv : bool - Export results to CSV files
     check_breakers : bool - Verify breaker interrupting capability
     output_dir : str - Output directory for CSV files (default: 'data')
+    force : bool - Recalculate even if the last results were for an identical network
     
     Returns:
     --------
     dict - Summary results
     """
+    import pandapower.shortcircuit as sc
+    from relay_coordination.analysis.reports import (
+        _bus_names, _sc_rows, export_sc_report, export_breaker_adequacy, export_ct_adequacy
+    )
+    
     if export_csv:
         import os
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-    import pandapower.shortcircuit as sc
-    from relay_coordination.analysis.reports import export_sc_report, export_breaker_adequacy, export_ct_adequacy
+        os.makedirs(output_dir, exist_ok=True)
     
     print("\n" + "="*80)
     print("SHORT CIRCUIT ANALYSIS (IEC 60909)")
     print("="*80)
     
     try:
-        # Calculate short circuit currents
-        sc.calc_sc(net, case='max', ip=True, ith=True, tk_s=1.0)
+        # Calculate short circuit currents, reusing the last result when the
+        # network tables are unchanged since that run
+        cached = getattr(net, '_sc_cache', None)
+        if not force and cached is not None and cached[0] == _sc_cache_key(net):
+            net.res_bus_sc = cached[1].copy()
+            print("\nUsing cached short circuit results (network unchanged)")
+        else:
+            sc.calc_sc(net, case='max', ip=True, ith=True, tk_s=1.0)
+            # Key on the tables as calc_sc leaves them (it may add columns)
+            net._sc_cache = (_sc_cache_key(net), net.res_bus_sc.copy())
         
         print(f"\nShort Circuit Results:")
         print(net.res_bus_sc[['ikss_ka', 'ip_ka']])
         
         # Check breaker ratings
         if check_breakers and hasattr(net, 'protection') and 'cb' in net.protection:
-            print("\nCircuit Breaker Adequacy Check:")
-            print(f"{'Breaker':<15} {'Bus':<20} {'Fault (kA)':<12} {'Rating (kA)':<12} {'Status':<10}")
-            print("-" * 75)
+            lines = [
+                "\nCircuit Breaker Adequacy Check:",
+                f"{'Breaker':<15} {'Bus':<20} {'Fault (kA)':<12} {'Rating (kA)':<12} {'Status':<10}",
+                "-" * 75,
+            ]
             
-            for cb in net.protection['cb']:
-                bus_idx = cb.bus
-                if bus_idx < len(net.res_bus_sc):
-                    ikss = net.res_bus_sc.at[bus_idx, 'ikss_ka']
-                    bus_name = net.bus.at[bus_idx, 'name']
+            cbs = net.protection['cb']
+            buses = [cb.bus for cb in cbs]
+            rows = _sc_rows(net, buses)
+            fault_ka = net.res_bus_sc['ikss_ka'].to_numpy()[rows]
+            bus_names = _bus_names(net, buses)
+            
+            for cb, row, ikss, bus_name in zip(cbs, rows, fault_ka, bus_names):
+                if row >= 0:
                     adequate = cb.check_interrupting_capability(ikss)
                     status = '✓ OK' if adequate else '✗ UPGRADE'
                     
-                    print(f"{cb.name:<15} {bus_name:<20} {ikss:<12.2f} {cb.interrupting_rating_ka_sym:<12.2f} {status:<10}")
+                    lines.append(f"{cb.name:<15} {bus_name:<20} {ikss:<12.2f} {cb.interrupting_rating_ka_sym:<12.2f} {status:<10}")
+            
+            print("\n".join(lines))
 
         # Check CT Saturation
         if check_breakers and hasattr(net, 'protection') and 'ct' in net.protection:
-            print("\nCT Saturation Check:")
-            print(f"{'CT Name':<15} {'Bus':<20} {'Fault (kA)':<12} {'Limit (A)':<12} {'Status':<10}")
-            print("-" * 75)
+            lines = [
+                "\nCT Saturation Check:",
+                f"{'CT Name':<15} {'Bus':<20} {'Fault (kA)':<12} {'Limit (A)':<12} {'Status':<10}",
+                "-" * 75,
+            ]
             
-            for ct in net.protection['ct']:
-                bus_idx = ct.bus
-                if bus_idx < len(net.res_bus_sc):
-                    ikss_ka = net.res_bus_sc.at[bus_idx, 'ikss_ka']
-                    bus_name = net.bus.at[bus_idx, 'name']
-                    
+            cts = net.protection['ct']
+            buses = [ct.bus for ct in cts]
+            rows = _sc_rows(net, buses)
+            fault_ka = net.res_bus_sc['ikss_ka'].to_numpy()[rows]
+            bus_names = _bus_names(net, buses)
+            
+            for ct, row, ikss_ka, bus_name in zip(cts, rows, fault_ka, bus_names):
+                if row >= 0:
                     # Calculate limits
                     i_primary = ikss_ka * 1000.0
                     i_secondary = ct.secondary_current(i_primary)
@@ -79,7 +115,9 @@ def run_sc_analysis(net, export_csv: bool = True, check_breakers: bool = True, o
                     adequate = i_secondary <= i_limit
                     status = '✓ OK' if adequate else '✗ SATURATES'
                     
-                    print(f"{ct.name:<15} {bus_name:<20} {ikss_ka:<12.2f} {i_limit:<12.2f} {status:<10}")
+                    lines.append(f"{ct.name:<15} {bus_name:<20} {ikss_ka:<12.2f} {i_limit:<12.2f} {status:<10}")
+            
+            print("\n".join(lines))
         
         # Export CSV files
         if export_csv:
@@ -1,7 +1,7 @@
 """Core module - Protection device classes"""
 
 from relay_coordination.core.ct import CT
-from relay_coordination.core.relay import Relay
+from relay_coordination.core.relay import Relay, RelayFleet
 from relay_coordination.core.cb import CircuitBreaker
 
-__all__ = ['CT', 'Relay', 'CircuitBreaker']
+__all__ = ['CT', 'Relay', 'RelayFleet', 'CircuitBreaker']
@@ -0,0 +1,257 @@
+"""
+Trip Time Kernels
+Array evaluation of t = TMS × K / (M^alpha - B) with the instantaneous element applied.
+Uses the optional C extension (_curves_ext) if built, else Numba if installed, else pure NumPy
+"""
+import math
+import threading
+import numpy as np
+
+# Fast-math flags without 'nnan'/'ninf': the kernel relies on inf/nan for
+# disabled elements and no-trip results
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Replaced by numba.prange when the Numba kernels are loaded
+prange = range
+
+# Fewest relays for which the Numba matrix kernel runs its parallel build; for
+# the usual handful of relays the thread start-up costs more than it saves
+_PARALLEL_MIN_RELAYS = 64
+
+
+def _curve_denominator(M, alpha, B):
+    """
+    M^alpha - B without a generic pow where the exponent allows it
+    
+    Integer exponents (IEC VI/EI/LTI, IEEE VI/EI) need no transcendental at all.
+    For B = 1 (IEC curves) expm1 avoids the cancellation of M^alpha - 1 near
+    pickup, which matters for small exponents such as IEC NI (alpha = 0.02).
+    """
+    if alpha == 1.0:
+        return M - B
+    if alpha == 2.0:
+        return M * M - B
+    if B == 1.0:
+        return math.expm1(alpha * math.log(M))
+    return math.exp(alpha * math.log(M)) - B
+
+
+def _py_curve_denominator(M, alpha, B):
+    """
+    _curve_denominator for scalar callers in the interpreter (never compiled)
+    
+    Calling a Numba dispatcher from Python costs more than the scalar math
+    itself. In CPython the M ** alpha operator is also faster than the two
+    calls of math.exp(alpha * math.log(M)), unlike in compiled or array code;
+    expm1 is kept for B = 1 for its accuracy near pickup.
+    """
+    if alpha == 1.0:
+        return M - B
+    if alpha == 2.0:
+        return M * M - B
+    if B == 1.0:
+        return math.expm1(alpha * math.log(M))
+    return M ** alpha - B
+
+
+def _curve_time(M, K, alpha, B, tms):
+    """Time-overcurrent operating time at current multiple M, np.inf at or below pickup"""
+    if M <= 1.0:
+        return np.inf
+    return tms * K / _py_curve_denominator(M, alpha, B)
+
+
+def _trip_time(current, pickup, tms, K, alpha, B, inst_pickup, inst_delay):
+    """
+    Trip time for a single current
+    
+    Parameters:
+    -----------
+    current : float - Fault current (A primary)
+    pickup : float - Time-overcurrent pickup (A), np.inf if disabled
+    tms : float - Time multiplier setting
+    K, alpha, B : float - Curve constants
+    inst_pickup : float - Instantaneous pickup (A), np.inf if disabled
+    inst_delay : float - Instantaneous delay (s)
+    
+    Returns:
+    --------
+    float - Trip time in seconds, np.nan if the relay doesn't trip
+    """
+    if current >= inst_pickup:
+        return inst_delay
+    if current >= pickup:
+        M = current / pickup
+        if M > 1.0:
+            return tms * K / _curve_denominator(M, alpha, B)
+        return np.inf
+    return np.nan
+
+
+def _trip_times_loop(I, pickup, tms, K, alpha, B, inst_pickup, inst_delay):
+    """Trip times of one relay for a 1-D array of currents (explicit loop, compiled by Numba)"""
+    out = np.empty(I.size)
+    for i in range(I.size):
+        out[i] = _trip_time(I[i], pickup, tms, K, alpha, B, inst_pickup, inst_delay)
+    return out
+
+
+def _trip_time_matrix_loop(I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays):
+    """Trip times of R relays (parameter arrays of shape (R,)) as an (R, len(I)) array"""
+    out = np.empty((pickups.size, I.size))
+    for r in range(pickups.size):
+        for i in range(I.size):
+            out[r, i] = _trip_time(I[i], pickups[r], tmss[r], Ks[r], alphas[r], Bs[r],
+                                   inst_pickups[r], inst_delays[r])
+    return out
+
+
+def _trip_time_matrix_prange(I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays):
+    """
+    _trip_time_matrix_loop with relays spread over threads (Numba parallel=True)
+    
+    A separate function rather than a second build of _trip_time_matrix_loop:
+    Numba's on-disk cache does not key on the parallel flag.
+    """
+    out = np.empty((pickups.size, I.size))
+    for r in prange(pickups.size):
+        for i in range(I.size):
+            out[r, i] = _trip_time(I[i], pickups[r], tmss[r], Ks[r], alphas[r], Bs[r],
+                                   inst_pickups[r], inst_delays[r])
+    return out
+
+
+def _trip_times_numpy(I, pickup, tms, K, alpha, B, inst_pickup, inst_delay, out=None):
+    """
+    Pure NumPy equivalent of _trip_times_loop
+    
+    Works in place in one float buffer (out, if given) instead of chaining
+    np.where over full-size temporaries; the masks are applied as assignments.
+    """
+    t = np.empty(I.shape) if out is None else out
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        M = I / pickup
+        if alpha == 1.0:
+            np.subtract(M, B, out=t)
+        elif alpha == 2.0:
+            np.multiply(M, M, out=t)
+            t -= B
+        else:
+            np.log(M, out=t)
+            t *= alpha
+            if B == 1.0:
+                np.expm1(t, out=t)
+            else:
+                np.exp(t, out=t)
+                t -= B
+        np.divide(tms * K, t, out=t)
+    t[M <= 1.0] = np.inf
+    t[I < pickup] = np.nan
+    t[I >= inst_pickup] = inst_delay
+    return t
+
+
+def _numba_parallel_safe() -> bool:
+    """
+    Whether Numba parallel kernels may be entered from several Python threads
+    
+    Numba's fallback 'workqueue' threading layer (used without TBB or OpenMP)
+    aborts the process on concurrent entry, which the serial kernels never do.
+    """
+    import numba
+    try:
+        from numba.np.ufunc.parallel import _launch_threads
+        _launch_threads()  # selects the threading layer
+        return numba.threading_layer() != 'workqueue'
+    except Exception:
+        return False
+
+
+def _numba_trip_time_matrix(serial, parallel):
+    """Numba trip_time_matrix using the parallel build only for large, thread-safe runs"""
+    use_parallel = None  # resolved on the first large fleet
+    
+    def trip_time_matrix(I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays):
+        nonlocal use_parallel
+        args = (I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays)
+        if pickups.size >= _PARALLEL_MIN_RELAYS:
+            if use_parallel is None:
+                use_parallel = _numba_parallel_safe()
+            if use_parallel:
+                return parallel(*args)
+        return serial(*args)
+    
+    return trip_time_matrix
+
+
+def _trip_time_matrix_numpy(I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays):
+    """Pure NumPy equivalent of _trip_time_matrix_loop"""
+    out = np.empty((pickups.size, I.size))
+    for r, params in enumerate(zip(pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays)):
+        _trip_times_numpy(I, *params, out=out[r])
+    return out
+
+
+# Selected array backend as (trip_times, trip_time_matrix), resolved on first
+# use so that importing the package does not pay for importing Numba
+_kernels = None
+_kernels_lock = threading.Lock()
+
+# Selected scalar curve_time, resolved on first use; never Numba, whose
+# dispatch costs more than the scalar math
+_scalar_curve_time = None
+
+
+def _load_kernels() -> tuple:
+    """Select the C extension, Numba or NumPy kernels, in that order of preference"""
+    global _kernels, _curve_denominator, _trip_time, prange
+    # Threads racing to the first call would otherwise jit the globals twice
+    with _kernels_lock:
+        if _kernels is not None:
+            return _kernels
+        try:
+            from relay_coordination.core._curves_ext import trip_times, trip_time_matrix
+        except ImportError:
+            try:
+                import numba
+            except ImportError:
+                trip_times = _trip_times_numpy
+                trip_time_matrix = _trip_time_matrix_numpy
+            else:
+                # The loop kernels resolve these module globals when Numba compiles them
+                prange = numba.prange
+                _curve_denominator = numba.njit(cache=True, fastmath=_FASTMATH)(_curve_denominator)
+                _trip_time = numba.njit(cache=True, fastmath=_FASTMATH)(_trip_time)
+                trip_times = numba.njit(cache=True, fastmath=_FASTMATH)(_trip_times_loop)
+                trip_time_matrix = _numba_trip_time_matrix(
+                    numba.njit(cache=True, fastmath=_FASTMATH)(_trip_time_matrix_loop),
+                    numba.njit(cache=True, fastmath=_FASTMATH, parallel=True)(_trip_time_matrix_prange))
+        
+        _kernels = (trip_times, trip_time_matrix)
+        return _kernels
+
+
+def _load_curve_time():
+    """Select the C extension or the interpreted scalar curve_time"""
+    global _scalar_curve_time
+    try:
+        from relay_coordination.core._curves_ext import curve_time
+    except ImportError:
+        curve_time = _curve_time
+    _scalar_curve_time = curve_time
+    return curve_time
+
+
+def trip_times(I, pickup, tms, K, alpha, B, inst_pickup, inst_delay):
+    """Trip times of one relay for a 1-D float64 array of currents (see _trip_time)"""
+    return (_kernels or _load_kernels())[0](I, pickup, tms, K, alpha, B, inst_pickup, inst_delay)
+
+
+def trip_time_matrix(I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays):
+    """Trip times of R relays (parameter arrays of shape (R,)) as an (R, len(I)) array"""
+    return (_kernels or _load_kernels())[1](I, pickups, tmss, Ks, alphas, Bs, inst_pickups, inst_delays)
+
+
+def curve_time(M, K, alpha, B, tms):
+    """Time-overcurrent operating time of one current multiple (see _curve_time)"""
+    return (_scalar_curve_time or _load_curve_time())(M, K, alpha, B, tms)
@@ -0,0 +1,73 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled Trip Time Kernels
+Optional C/OpenMP build of the kernels in core/_curves.py (same signatures and results)
+"""
+import numpy as np
+from cython.parallel import prange
+from libc.math cimport exp, expm1, log, INFINITY, NAN
+
+
+cdef inline double _curve_denominator(double M, double alpha, double B) noexcept nogil:
+    # M^alpha - B; see _curve_denominator in core/_curves.py
+    if alpha == 1.0:
+        return M - B
+    if alpha == 2.0:
+        return M * M - B
+    if B == 1.0:
+        return expm1(alpha * log(M))
+    return exp(alpha * log(M)) - B
+
+
+cdef inline double _curve_time(double M, double K, double alpha, double B, double tms) noexcept nogil:
+    if M <= 1.0:
+        return INFINITY
+    return tms * K / _curve_denominator(M, alpha, B)
+
+
+cdef inline double _trip_time(double current, double pickup, double tms, double K, double alpha,
+                              double B, double inst_pickup, double inst_delay) noexcept nogil:
+    if current >= inst_pickup:
+        return inst_delay
+    if current >= pickup:
+        return _curve_time(current / pickup, K, alpha, B, tms)
+    return NAN
+
+
+cdef void trip_times_c(const double* I, Py_ssize_t n, double pickup, double tms, double K,
+                       double alpha, double B, double inst_pickup, double inst_delay,
+                       double* out) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(n):
+        out[i] = _trip_time(I[i], pickup, tms, K, alpha, B, inst_pickup, inst_delay)
+
+
+def curve_time(double M, double K, double alpha, double B, double tms):
+    """Time-overcurrent operating time at current multiple M, inf at or below pickup"""
+    return _curve_time(M, K, alpha, B, tms)
+
+
+def trip_times(const double[::1] I, double pickup, double tms, double K, double alpha,
+               double B, double inst_pickup, double inst_delay):
+    """Trip times of one relay for a 1-D array of currents, np.nan where it doesn't trip"""
+    cdef Py_ssize_t n = I.shape[0]
+    out = np.empty(n)
+    cdef double[::1] out_view = out
+    if n > 0:
+        with nogil:
+            trip_times_c(&I[0], n, pickup, tms, K, alpha, B, inst_pickup, inst_delay, &out_view[0])
+    return out
+
+
+def trip_time_matrix(const double[::1] I, const double[::1] pickups, const double[::1] tmss,
+                     const double[::1] Ks, const double[::1] alphas, const double[::1] Bs,
+                     const double[::1] inst_pickups, const double[::1] inst_delays):
+    """Trip times of R relays (parameter arrays of shape (R,)) as an (R, len(I)) array"""
+    cdef Py_ssize_t n = I.shape[0], R = pickups.shape[0], r
+    out = np.empty((R, n))
+    cdef double[:, ::1] out_view = out
+    if n > 0:
+        for r in prange(R, nogil=True):
+            trip_times_c(&I[0], n, pickups[r], tmss[r], Ks[r], alphas[r], Bs[r],
+                         inst_pickups[r], inst_delays[r], &out_view[r, 0])
+    return out
@@ -9,6 +9,10 @@ from typing import Optional
 class CircuitBreaker:
     """Circuit Breaker Model (ETAP-compatible)"""
     
+    __slots__ = ('net', 'bus', 'relay', 'rated_voltage_kv', 'continuous_current_a',
+                 'interrupting_rating_ka_sym', 'interrupting_rating_ka_asym',
+                 'making_capacity_ka_peak', 'cb_type', 'name', 'state', 'operating_time', 'index')
+    
     def __init__(self,
                  net,
                  bus: int,
@@ -91,11 +95,24 @@ class CircuitBreaker:
         if self.relay is None:
             return None
         
-        relay_time = self.relay.calculate_trip_time(fault_current, fault_type)
-        if relay_time is None:
+        return self.add_operating(self.relay.calculate_trip_time(fault_current, fault_type))
+    
+    def add_operating(self, trip_time):
+        """
+        Total clearing time from an already calculated relay trip time
+        
+        Parameters:
+        -----------
+        trip_time : float or np.ndarray - Relay trip time(s) in seconds, None (or NaN) if no trip
+        
+        Returns:
+        --------
+        float or np.ndarray - trip_time + CB operating time, None if trip_time is None
+        """
+        if trip_time is None:
             return None
         
-        return relay_time + self.operating_time
+        return trip_time + self.operating_time
     
     def trip(self):
         """Open the circuit breaker"""
@@ -2,13 +2,33 @@
 Current Transformer (CT) Module
 ETAP-compatible CT modeling with IEC/ANSI accuracy classes
 """
+import re
 import warnings
+import numpy as np
+from functools import lru_cache
 from typing import Optional
 
 
+# IEC protection class <error%>P<ALF>, e.g. "5P20", "10P10"
+_IEC_CLASS_RE = re.compile(r'\s*(\d+(?:\.\d+)?)\s*P\s*(\d+(?:\.\d+)?)\s*')
+
+
+@lru_cache(maxsize=64)
+def _parse_iec(accuracy_class: str) -> Optional[tuple]:
+    """Parse an IEC accuracy class into (composite_error_pct, alf), None if malformed"""
+    match = _IEC_CLASS_RE.fullmatch(accuracy_class)
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
 class CT:
     """Current Transformer Model (ETAP-compatible)"""
     
+    __slots__ = ('net', 'bus', 'element', 'element_type', 'primary_rating', 'secondary_rating',
+                 'ratio', 'burden_va', 'accuracy_class_iec', 'accuracy_class_ansi', 'ct_type',
+                 'name', 'composite_error_pct', 'alf', 'index', '_warned_saturation')
+    
     def __init__(self, 
                  net,
                  bus: int,
@@ -71,14 +91,13 @@ class CT:
         
     def _parse_iec_class(self):
         """Parse IEC accuracy class string (e.g., '5P20')"""
-        try:
-            parts = self.accuracy_class_iec.replace('P', ' ').split()
-            self.composite_error_pct = float(parts[0])
-            self.alf = float(parts[1])  # Accuracy Limit Factor
-        except:
+        parsed = _parse_iec(self.accuracy_class_iec) if isinstance(self.accuracy_class_iec, str) else None
+        if parsed is None:
             warnings.warn(f"Could not parse IEC class {self.accuracy_class_iec}, using defaults")
             self.composite_error_pct = 5.0
             self.alf = 20.0
+        else:
+            self.composite_error_pct, self.alf = parsed  # alf: Accuracy Limit Factor
     
     def secondary_current(self, primary_current: float) -> float:
         """
@@ -94,15 +113,41 @@ class CT:
         """
         # Simple linear transformation (saturation modeling can be added)
         i_secondary = primary_current / self.ratio
+        if self._warned_saturation:
+            return i_secondary
         
         # Check if within accuracy limit
         i_limit = self.secondary_rating * self.alf
-        if i_secondary > i_limit and not self._warned_saturation:
+        if i_secondary > i_limit:
             warnings.warn(f"{self.name}: Secondary current {i_secondary:.2f}A exceeds accuracy limit {i_limit:.2f}A - CT may saturate")
             self._warned_saturation = True
         
         return i_secondary
     
+    def secondary_current_array(self, primary_current: np.ndarray) -> tuple:
+        """
+        Calculate secondary currents for an array of primary currents
+        
+        Parameters:
+        -----------
+        primary_current : np.ndarray - Primary currents in A
+        
+        Returns:
+        --------
+        tuple - (secondary currents in A, boolean mask of points beyond the accuracy limit)
+        """
+        i_secondary = np.asarray(primary_current, dtype=float) / self.ratio
+        
+        # One warning for the whole array, as the scalar check would give
+        i_limit = self.secondary_rating * self.alf
+        saturated = i_secondary > i_limit
+        if not self._warned_saturation and saturated.any():
+            first = i_secondary.flat[np.argmax(saturated)]
+            warnings.warn(f"{self.name}: Secondary current {first:.2f}A exceeds accuracy limit {i_limit:.2f}A - CT may saturate")
+            self._warned_saturation = True
+        
+        return i_secondary, saturated
+    
     def primary_current(self, secondary_current: float) -> float:
         """Calculate primary current from secondary current"""
         return secondary_current * self.ratio
@@ -2,6 +2,8 @@
 Relay Curve Definitions
 Standards: IEC 60255, IEEE/ANSI C37, IEC 61363
 """
+import numpy as np
+from enum import IntEnum
 
 # ============================================================================
 # IEC 60255 Standard Curves
@@ -138,6 +140,10 @@ ALL_CURVES.update(IEEE_CURVES)
 ALL_CURVES.update(ANSI_CURVES)
 ALL_CURVES.update(IEC_61363_CURVES)
 
+# Curve families by formula, for single-lookup membership tests
+_IEC_SET = frozenset(IEC_CURVES) | frozenset(IEC_61363_CURVES)
+_IEEE_SET = frozenset(IEEE_CURVES) | frozenset(ANSI_CURVES)
+
 # ============================================================================
 # Curve Type Detection
 # ============================================================================
@@ -170,12 +176,110 @@ def get_curve_params(curve_type: str) -> dict:
 
 def is_iec_curve(curve_type: str) -> bool:
     """Check if curve uses IEC formula"""
-    return curve_type in IEC_CURVES or curve_type in IEC_61363_CURVES
+    return curve_type in _IEC_SET
 
 
 def is_ieee_curve(curve_type: str) -> bool:
     """Check if curve uses IEEE/ANSI formula"""
-    return curve_type in IEEE_CURVES or curve_type in ANSI_CURVES
+    return curve_type in _IEEE_SET
+
+
+# ============================================================================
+# Integer Curve IDs
+# ============================================================================
+
+# One member per curve in ALL_CURVES order (CurveID.IEC_NI == 0, ...), used to
+# index the constant arrays below
+CurveID = IntEnum('CurveID', [(curve_type, index) for index, curve_type in enumerate(ALL_CURVES)])
+
+# Formula families
+FORMULA_IEC = 0
+FORMULA_IEEE = 1
+
+# Constants of t = TMS × K / (M^alpha - B) indexed by CurveID
+# (IEC: K = k, alpha = alpha, B = 1; IEEE/ANSI: K = A, alpha = p, B = B)
+CURVE_FORMULA = np.array([FORMULA_IEC if is_iec_curve(c) else FORMULA_IEEE for c in ALL_CURVES], dtype=np.int8)
+CURVE_K = np.array([p['k'] if is_iec_curve(c) else p['A'] for c, p in ALL_CURVES.items()])
+CURVE_ALPHA = np.array([p['alpha'] if is_iec_curve(c) else p['p'] for c, p in ALL_CURVES.items()])
+CURVE_B = np.array([1.0 if is_iec_curve(c) else p['B'] for c, p in ALL_CURVES.items()])
+
+
+def resolve(curve_type: str) -> tuple:
+    """
+    Resolve a curve identifier to integer indices (one string lookup)
+    
+    Parameters:
+    -----------
+    curve_type : str - Curve identifier (e.g., 'IEC_NI')
+    
+    Returns:
+    --------
+    tuple - (formula_id, CurveID); formula_id is FORMULA_IEC or FORMULA_IEEE
+    
+    Raises:
+    -------
+    ValueError - If curve type not found
+    """
+    curve_id = CurveID.__members__.get(curve_type)
+    if curve_id is None:
+        get_curve_params(curve_type)  # raises ValueError listing the available curves
+    return int(CURVE_FORMULA[curve_id]), curve_id
+
+
+# ============================================================================
+# Curve Shape Lookup Tables
+# ============================================================================
+
+# Current multiples covered by the lookup tables
+LUT_M_MIN = 1.001
+LUT_M_MAX = 1000.0
+LUT_POINTS = 1024
+
+
+def _build_curve_lut() -> dict:
+    """
+    Tabulate every curve's shape f(M) = K / (M^alpha - B)
+    
+    The grid is uniform in log(M - 1) and the table holds log f. Near pickup
+    f ~ 1/(M - 1) and far above it f ~ M^-alpha, so log f is close to linear
+    in log(M - 1) over the whole range and interpolates well at the pole.
+    """
+    x = np.linspace(np.log(LUT_M_MIN - 1.0), np.log(LUT_M_MAX - 1.0), LUT_POINTS)
+    M = 1.0 + np.exp(x)
+    lut = {}
+    for curve_type, params in ALL_CURVES.items():
+        if is_iec_curve(curve_type):
+            f = params['k'] / (np.power(M, params['alpha']) - 1.0)
+        else:
+            f = params['A'] / (np.power(M, params['p']) - params['B'])
+        lut[curve_type] = (x, np.log(f))
+    return lut
+
+
+# curve_type -> (log(M - 1) grid, log f(M) values), built once at import
+CURVE_LUT = _build_curve_lut()
+
+
+def curve_shape(curve_type: str, M: np.ndarray) -> np.ndarray:
+    """
+    Approximate curve shape f(M) = K / (M^alpha - B) by table lookup
+    
+    Linear interpolation on CURVE_LUT, for plotting-grade accuracy. Results
+    are clamped to the table ends outside [LUT_M_MIN, LUT_M_MAX].
+    
+    Parameters:
+    -----------
+    curve_type : str - Curve identifier (e.g., 'IEC_NI')
+    M : np.ndarray - Current multiples (I/Ipickup)
+    
+    Returns:
+    --------
+    np.ndarray - f(M); trip time is TMS × f(M)
+    """
+    if curve_type not in CURVE_LUT:
+        get_curve_params(curve_type)  # raises ValueError listing the available curves
+    x, log_f = CURVE_LUT[curve_type]
+    return np.exp(np.interp(np.log(M - 1.0), x, log_f))
 
 
 def list_curves_by_standard(standard: str = None) -> list:
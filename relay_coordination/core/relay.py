@@ -3,14 +3,49 @@ Protection Relay Module
 ETAP-compatible relay modeling with IEC 60255, IEEE/ANSI C37, and IEC 61363 curves
 """
 import numpy as np
-import pandas as pd
 from typing import Optional
-from relay_coordination.core.curves import get_curve_params, is_iec_curve, is_ieee_curve
+from relay_coordination.core.curves import (CURVE_ALPHA, CURVE_B, CURVE_K, LUT_M_MAX, LUT_M_MIN,
+                                            curve_shape, resolve)
+from relay_coordination.core._curves import curve_time, trip_times, trip_time_matrix
+
+
+# Curve constants (K, alpha, B) for t = TMS × K / (M^alpha - B) as plain floats,
+# indexed by CurveID. IEC curves are the B = 1 case of the IEEE/ANSI formula.
+_CURVE_TABLE = tuple(zip(CURVE_K.tolist(), CURVE_ALPHA.tolist(), CURVE_B.tolist()))
+
+# Settings the cached curve constants are derived from
+_CURVE_SETTINGS = frozenset(('phase_pickup', 'phase_curve', 'ground_pickup', 'ground_curve'))
+
+# Settings the cached kernel parameters and trip times are derived from
+_TRIP_SETTINGS = frozenset(('phase_pickup', 'phase_curve', 'phase_tms', 'phase_enabled',
+                            'phase_inst_pickup', 'phase_inst_delay', 'phase_inst_enabled',
+                            'ground_pickup', 'ground_curve', 'ground_tms', 'ground_enabled',
+                            'ground_inst_pickup', 'ground_inst_delay', 'ground_inst_enabled'))
+
+# Trip times kept per relay by (current, fault type); the oldest entry is
+# evicted first once a relay's cache is full
+_TRIP_CACHE_SIZE = 32
+_MISSING = object()
+
+
+def _curve_constants(curve_type: str) -> tuple:
+    """Look up (K, alpha, B) for a curve type (raises ValueError if unknown)"""
+    return _CURVE_TABLE[resolve(curve_type)[1]]
 
 
 class Relay:
     """Protection Relay Model (ETAP-compatible)"""
     
+    __slots__ = ('net', 'ct', 'cb', 'manufacturer', 'model', 'name', 'index',
+                 'phase_pickup', 'phase_curve', 'phase_tms', 'phase_enabled',
+                 'phase_inst_pickup', 'phase_inst_delay', 'phase_inst_enabled',
+                 'ground_pickup', 'ground_curve', 'ground_tms', 'ground_enabled',
+                 'ground_inst_pickup', 'ground_inst_delay', 'ground_inst_enabled',
+                 # Cached curve constants (see _resolve_curves)
+                 '_phase_K', '_phase_alpha', '_phase_B', '_inv_phase_pickup',
+                 '_ground_K', '_ground_alpha', '_ground_B', '_inv_ground_pickup',
+                 '_kernel_params_cache', '_trip_cache')
+    
     def __init__(self,
                  net,
                  ct,
@@ -100,6 +135,10 @@ class Relay:
         self.ground_inst_delay = ground_inst_delay / 1000.0  # Convert ms to s
         self.ground_inst_enabled = ground_inst_enabled
         
+        # Curve constants used by the trip time calculations
+        self._resolve_curves()
+        self._reset_caches()
+        
         # Store in network
         if not hasattr(net, 'protection'):
             net.protection = {}
@@ -113,6 +152,29 @@ class Relay:
         if cb is not None:
             cb.relay = self
     
+    def __setattr__(self, name, value):
+        # Reject an unknown curve before it replaces the current one
+        if name in ('phase_curve', 'ground_curve'):
+            _curve_constants(value)
+        object.__setattr__(self, name, value)
+        # Keep the cached curve constants in step with later setting changes
+        if name in _CURVE_SETTINGS and hasattr(self, '_phase_K'):
+            self._resolve_curves()
+        if name in _TRIP_SETTINGS and hasattr(self, '_kernel_params_cache'):
+            self._reset_caches()
+    
+    def _reset_caches(self):
+        """Drop cached kernel parameters and trip times (after a setting change)"""
+        self._kernel_params_cache = {}
+        self._trip_cache = {}
+    
+    def _resolve_curves(self):
+        """Cache curve constants and reciprocal pickups for the selected curves"""
+        self._phase_K, self._phase_alpha, self._phase_B = _curve_constants(self.phase_curve)
+        self._inv_phase_pickup = 1.0 / self.phase_pickup if self.phase_pickup is not None else None
+        self._ground_K, self._ground_alpha, self._ground_B = _curve_constants(self.ground_curve)
+        self._inv_ground_pickup = 1.0 / self.ground_pickup if self.ground_pickup is not None else None
+    
     def calculate_trip_time(self, fault_current: float, fault_type: str = "phase") -> Optional[float]:
         """
         Calculate relay trip time for given fault current
@@ -126,8 +188,19 @@ class Relay:
         --------
         float - Trip time in seconds, or None if relay doesn't trip
         """
-        # Convert to secondary current
-        i_secondary = self.ct.secondary_current(fault_current)
+        # Selectivity checks and iterative studies reuse the same few currents
+        key = (fault_current, fault_type)
+        trip_time = self._trip_cache.get(key, _MISSING)
+        if trip_time is _MISSING:
+            trip_time = self._compute_trip_time(fault_current, fault_type)
+            if len(self._trip_cache) >= _TRIP_CACHE_SIZE:
+                del self._trip_cache[next(iter(self._trip_cache))]
+            self._trip_cache[key] = trip_time
+        return trip_time
+    
+    def _compute_trip_time(self, fault_current: float, fault_type: str = "phase") -> Optional[float]:
+        """Uncached calculate_trip_time"""
+        # Elements are set in primary amperes, so no secondary conversion is needed
         i_primary = fault_current
         
         if fault_type == "phase":
@@ -140,9 +213,10 @@ class Relay:
             if self.phase_enabled and self.phase_pickup is not None:
                 if i_primary >= self.phase_pickup:
                     trip_time = self._calculate_curve_time(
-                        i_primary, 
-                        self.phase_pickup, 
-                        self.phase_curve, 
+                        i_primary * self._inv_phase_pickup,
+                        self._phase_K,
+                        self._phase_alpha,
+                        self._phase_B,
                         self.phase_tms
                     )
                     return trip_time
@@ -157,60 +231,113 @@ class Relay:
             if self.ground_enabled and self.ground_pickup is not None:
                 if i_primary >= self.ground_pickup:
                     trip_time = self._calculate_curve_time(
-                        i_primary,
-                        self.ground_pickup,
-                        self.ground_curve,
+                        i_primary * self._inv_ground_pickup,
+                        self._ground_K,
+                        self._ground_alpha,
+                        self._ground_B,
                         self.ground_tms
                     )
                     return trip_time
         
         return None  # Relay doesn't trip
+
+    def calculate_trip_time_vec(self, I: np.ndarray, fault_type: str = "phase",
+                                accurate: bool = True) -> np.ndarray:
+        """
+        Vectorized trip time evaluation over an array of fault currents
+
+        Same element logic as calculate_trip_time, evaluated by a single
+        array kernel (core._curves) instead of one Python call per current.
+
+        Parameters:
+        -----------
+        I : np.ndarray - Fault current magnitudes (A primary)
+        fault_type : str - "phase" or "ground"
+        accurate : bool - Exact curve formula (default); False interpolates the
+            curve shape from curves.CURVE_LUT (plotting-grade accuracy)
+
+        Returns:
+        --------
+        np.ndarray - Trip times in seconds, np.nan where the relay doesn't trip
+        """
+        I = np.asarray(I, dtype=float)
+        self.ct.secondary_current_array(I)  # CT saturation warning
+        params = self._kernel_params(fault_type)
+        if params is None:
+            return np.full(I.shape, np.nan)
+        
+        if accurate:
+            return trip_times(I.ravel(), *params).reshape(I.shape)
+        
+        # Table lookup for time-overcurrent points inside the table; the exact
+        # kernel covers the rest (near pickup, beyond the table, instantaneous)
+        pickup, tms, inst_pickup = params[0], params[1], params[5]
+        M = I / pickup
+        in_table = (M >= LUT_M_MIN) & (M <= LUT_M_MAX) & (I < inst_pickup)
+        t = np.empty(I.shape)
+        t[in_table] = tms * curve_shape(getattr(self, f"{fault_type}_curve"), M[in_table])
+        t[~in_table] = trip_times(I[~in_table], *params)
+        return t
     
-    def _calculate_curve_time(self, current: float, pickup: float, curve_type: str, tms: float) -> float:
+    def _kernel_params(self, fault_type: str) -> Optional[tuple]:
+        """
+        Element settings as plain floats for the trip time kernels
+        
+        Returns (pickup, tms, K, alpha, B, inst_pickup, inst_delay), with np.inf
+        as the pickup of a disabled element, or None for an unknown fault type.
+        Resolved once per fault type until a setting changes.
+        """
+        params = self._kernel_params_cache.get(fault_type)
+        if params is None and fault_type in ("phase", "ground"):
+            params = self._kernel_params_cache[fault_type] = self._resolve_kernel_params(fault_type)
+        return params
+    
+    def _resolve_kernel_params(self, fault_type: str) -> tuple:
+        """Build the _kernel_params tuple from the current settings"""
+        pickup = getattr(self, f"{fault_type}_pickup")
+        if getattr(self, f"{fault_type}_enabled") and pickup is not None:
+            pickup, tms = float(pickup), float(getattr(self, f"{fault_type}_tms"))
+        else:
+            pickup, tms = np.inf, 0.0
+        
+        inst_pickup = getattr(self, f"{fault_type}_inst_pickup")
+        if not getattr(self, f"{fault_type}_inst_enabled") or inst_pickup is None:
+            inst_pickup = np.inf
+        
+        return (pickup, tms,
+                getattr(self, f"_{fault_type}_K"),
+                getattr(self, f"_{fault_type}_alpha"),
+                getattr(self, f"_{fault_type}_B"),
+                float(inst_pickup),
+                float(getattr(self, f"{fault_type}_inst_delay")))
+
+    @staticmethod
+    def _calculate_curve_time(M: float, K: float, alpha: float, B: float, tms: float) -> float:
         """
         Calculate trip time using IEC 60255, IEEE/ANSI C37, or IEC 61363 curves
         
         IEC Formula: t = TMS × K / ((I/Ipickup)^α - 1)
         IEEE/ANSI Formula: t = TD × (A / ((I/Ipickup)^p - B))
         
+        Both are evaluated as t = TMS × K / (M^alpha - B) with constants from _CURVE_TABLE,
+        by the compiled scalar kernel when one is available (core._curves).
+        
         Parameters:
         -----------
-        current : float - Fault current (A)
-        pickup : float - Pickup threshold (A)
-        curve_type : str - Curve identifier
+        M : float - Current multiple (I/Ipickup)
+        K : float - Curve constant (k for IEC, A for IEEE/ANSI)
+        alpha : float - Curve exponent (alpha for IEC, p for IEEE/ANSI)
+        B : float - Curve offset (1 for IEC, B for IEEE/ANSI)
         tms : float - Time multiplier setting
         
         Returns:
         --------
         float - Operating time in seconds
         """
-        M = current / pickup  # Current multiple
-        
-        if M <= 1.0:
-            return float('inf')  # Below pickup, never trips
-        
-        # Get curve parameters from centralized curves module
-        params = get_curve_params(curve_type)
-        
-        # IEC curves (IEC 60255, IEC 61363)
-        if is_iec_curve(curve_type):
-            k = params['k']
-            alpha = params['alpha']
-            t = tms * k / (M**alpha - 1.0)
-            return t
-        
-        # IEEE/ANSI curves
-        elif is_ieee_curve(curve_type):
-            A = params['A']
-            B = params['B']
-            p = params['p']
-            t = tms * (A / (M**p - B))
-            return t
-        
-        else:
-            raise ValueError(f"Unknown curve type: {curve_type}")
+        return curve_time(M, K, alpha, B, tms)  # inf at or below pickup, never trips
     
-    def generate_tcc_data(self, current_range: np.ndarray, fault_type: str = "phase") -> pd.DataFrame:
+    def generate_tcc_data(self, current_range: np.ndarray, fault_type: str = "phase",
+                          to_dataframe: bool = True):
         """
         Generate Time-Current Characteristic (TCC) curve data
         
@@ -218,15 +345,20 @@ class Relay:
         -----------
         current_range : np.ndarray - Array of current values (A)
         fault_type : str - "phase" or "ground"
+        to_dataframe : bool - Return a DataFrame (default); False returns plain
+            arrays, skipping the DataFrame construction for repeated regeneration
         
         Returns:
         --------
-        pd.DataFrame - DataFrame with columns ['current', 'time']
+        pd.DataFrame - DataFrame with columns ['current', 'time'], or
+        tuple - (current, time) arrays if to_dataframe is False
         """
-        times = []
-        for i in current_range:
-            t = self.calculate_trip_time(i, fault_type)
-            times.append(t if t is not None else np.nan)
+        current = np.asarray(current_range, dtype=float)
+        times = self.calculate_trip_time_vec(current, fault_type)
+        if not to_dataframe:
+            return current, times
+        
+        import pandas as pd
         
         return pd.DataFrame({
             'current': current_range,
@@ -237,6 +369,102 @@ class Relay:
         return f"Relay(name={self.name}, model={self.manufacturer} {self.model})"
 
 
+class RelayFleet:
+    """
+    Settings of a group of relays as contiguous per-parameter arrays
+    
+    A snapshot for network-wide studies: the settings are gathered once, and
+    every trip_times call evaluates all relays in a single kernel call,
+    parallel over relays when compiled kernels are available. Rebuild the
+    fleet after changing relay settings.
+    """
+    
+    __slots__ = ('relays', 'fault_type', 'pickup', 'tms', 'K', 'alpha', 'B', 'inst_pickup', 'inst_delay')
+    
+    # Kernel parameters of a relay that never trips (unknown fault type)
+    _NO_TRIP = (np.inf, 0.0, 1.0, 1.0, 1.0, np.inf, 0.0)
+    
+    def __init__(self, relays, fault_type, pickup, tms, K, alpha, B, inst_pickup, inst_delay):
+        """
+        Initialize from per-parameter arrays of shape (len(relays),); see from_relays
+        """
+        self.relays = relays
+        self.fault_type = fault_type
+        self.pickup = pickup
+        self.tms = tms
+        self.K = K
+        self.alpha = alpha
+        self.B = B
+        self.inst_pickup = inst_pickup
+        self.inst_delay = inst_delay
+    
+    @classmethod
+    def from_relays(cls, relays, fault_type: str = "phase") -> "RelayFleet":
+        """
+        Gather relay settings into per-parameter arrays
+        
+        Parameters:
+        -----------
+        relays : List[Relay] - Relays to evaluate together
+        fault_type : str - "phase" or "ground"
+        
+        Returns:
+        --------
+        RelayFleet - Fleet in the order of relays
+        """
+        relays = list(relays)
+        params = [relay._kernel_params(fault_type) for relay in relays]
+        if None in params:
+            params = [cls._NO_TRIP] * len(relays)
+        
+        # One C-contiguous row per parameter
+        columns = np.array(params, dtype=float).reshape(-1, len(cls._NO_TRIP)).T.copy()
+        return cls(relays, fault_type, *columns)
+    
+    def trip_times(self, currents: np.ndarray) -> np.ndarray:
+        """
+        Trip times of every relay at every current
+        
+        The kernels compute in double precision; float32 currents give float32
+        results (e.g. for plotting, which doesn't need more).
+        
+        Parameters:
+        -----------
+        currents : np.ndarray - Fault current magnitudes (A primary)
+        
+        Returns:
+        --------
+        np.ndarray - Shape (len(currents), len(relays)), np.nan where a relay doesn't trip
+        """
+        currents = np.asarray(currents)
+        I = np.ascontiguousarray(currents, dtype=float).ravel()
+        times = trip_time_matrix(I, self.pickup, self.tms, self.K, self.alpha, self.B,
+                                 self.inst_pickup, self.inst_delay).T
+        if currents.dtype == np.float32:
+            times = times.astype(np.float32)
+        return times
+    
+    def __len__(self):
+        return len(self.relays)
+    
+    def __repr__(self):
+        return f"RelayFleet({len(self.relays)} relays, fault_type={self.fault_type})"
+
+
+def _trip_time_matrix(relays, I: np.ndarray, fault_type: str = "phase") -> np.ndarray:
+    """
+    Trip times of every relay at every current
+    
+    Returns:
+    --------
+    np.ndarray - Shape (len(relays), len(I)), np.nan where a relay doesn't trip
+    """
+    for relay in relays:
+        relay.ct.secondary_current_array(I)  # CT saturation warning
+    
+    return RelayFleet.from_relays(relays, fault_type).trip_times(I).T
+
+
 def add_relay(net,
               ct,
               cb,
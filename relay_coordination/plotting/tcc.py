@@ -6,8 +6,70 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
+from functools import lru_cache
 from typing import List
 from matplotlib.ticker import ScalarFormatter
+from relay_coordination.analysis.reports import _coordination_csv_columns, _format_times
+from relay_coordination.core.relay import _trip_time_matrix
+
+
+# Relay curve colors, cycled in relay order
+_TAB10 = plt.get_cmap('tab10').colors
+
+
+@lru_cache(maxsize=16)
+def _current_grid(current_min: float, current_max: float, n: int, log: bool = True) -> np.ndarray:
+    """
+    Current grid for TCC plots, shared by repeated plots over the same range
+    
+    Single precision is plenty for plotting. The array is read-only because
+    every caller with the same arguments gets the same object.
+    """
+    if log:
+        grid = np.logspace(np.log10(current_min), np.log10(current_max), n, dtype=np.float32)
+    else:
+        grid = np.linspace(current_min, current_max, n, dtype=np.float32)
+    grid.flags.writeable = False
+    return grid
+
+
+def _plotted_points(current_range: np.ndarray, params, t_min: float = 0.01):
+    """
+    Points of a TCC curve with a finite trip time above t_min, found analytically
+    
+    Trip time is non-increasing in current, so the plotted points are the
+    time-overcurrent run from just above pickup until the curve reaches t_min
+    (or the instantaneous pickup), plus the instantaneous run if its delay is
+    above t_min. Both ends come from np.searchsorted on the sorted current grid.
+    
+    Parameters:
+    -----------
+    current_range : np.ndarray - Ascending current grid (A)
+    params : tuple - Relay._kernel_params for the fault type, or None
+    t_min : float - Times at or below this are not plotted (s)
+    
+    Returns:
+    --------
+    slice or np.ndarray - Index into current_range and the trip times
+    """
+    if params is None:
+        return slice(0, 0)
+    pickup, tms, K, alpha, B, inst_pickup, inst_delay = params
+    
+    # Time-overcurrent run: tms*K / (M^alpha - B) > t_min  <=>  M < (tms*K/t_min + B)^(1/alpha)
+    start = np.searchsorted(current_range, pickup, side='right')
+    inst_start = np.searchsorted(current_range, inst_pickup, side='left')
+    if alpha > 0.0:
+        end = np.searchsorted(current_range, pickup * (tms * K / t_min + B) ** (1.0 / alpha), side='left')
+    else:
+        end = current_range.size if tms * K / (1.0 - B) > t_min else start  # Definite time
+    end = min(end, inst_start)
+    
+    if inst_delay <= t_min or inst_start == current_range.size:
+        return slice(start, max(start, end))
+    if end >= inst_start and start <= inst_start:
+        return slice(start, current_range.size)
+    return np.r_[start:max(start, end), inst_start:current_range.size]
 
 
 def plot_tcc_curves(relays: List,  
@@ -40,10 +102,7 @@ def plot_tcc_curves(relays: List,
     """
     
     # Create current range (log-spaced or linear)
-    if x_scale == "log":
-        current_range = np.logspace(np.log10(current_min), np.log10(current_max), 500)
-    else:
-        current_range = np.linspace(current_min, current_max, 500)
+    current_range = _current_grid(current_min, current_max, 500, x_scale == "log")
     
     # Create figure
     fig, ax = plt.subplots(figsize=figsize)
@@ -52,20 +111,13 @@ def plot_tcc_curves(relays: List,
     ax.set_xscale(x_scale)
     ax.set_yscale(y_scale)
     
-    # Color palette
-    colors = plt.cm.tab10(np.linspace(0, 1, len(relays)))
+    # Generate TCC data for all relays on the shared current grid in one pass
+    trip_matrix = _trip_time_matrix(relays, current_range, fault_type)
     
     # Plot each relay's TCC curve
     for idx, relay in enumerate(relays):
-        color = colors[idx]
-        
-        # Generate TCC data
-        times = []
-        for i in current_range:
-            t = relay.calculate_trip_time(i, fault_type)
-            times.append(t if t is not None else np.nan)
-        
-        times = np.array(times)
+        color = _TAB10[idx % len(_TAB10)]
+        times = trip_matrix[idx]
         
         # Plot time-overcurrent curve (51/51N)
         if fault_type == "phase":
@@ -75,24 +127,19 @@ def plot_tcc_curves(relays: List,
             pickup = relay.ground_pickup
             curve_label = f"{relay.name} - 51N ({relay.ground_curve})"
         
-        # Plot curve (excluding instantaneous portion)
-        valid = ~np.isnan(times) & (times > 0.01)  # Filter out instantaneous trips
-        if np.any(valid):
-            ax.plot(current_range[valid], times[valid], 
+        # Plot curve (excluding instantaneous portion); times already include
+        # the instantaneous element, applied by the kernel with these parameters
+        params = relay._kernel_params(fault_type)
+        valid = _plotted_points(current_range, params)  # Filter out instantaneous trips
+        currents = current_range[valid]
+        if currents.size:
+            ax.plot(currents, times[valid], 
                     color=color, linewidth=2.5, label=curve_label)
         
-        # Plot instantaneous element (50/50N)
-        if fault_type == "phase" and relay.phase_inst_enabled and relay.phase_inst_pickup:
-            inst_pickup = relay.phase_inst_pickup
-            inst_delay = relay.phase_inst_delay
-            
-            # Vertical line at instantaneous pickup
-            ax.vlines(inst_pickup, 0.01, 100, colors=color, linestyles='dotted')
-        
-        elif fault_type == "ground" and relay.ground_inst_enabled and relay.ground_inst_pickup:
-            inst_pickup = relay.ground_inst_pickup
-            
-            ax.vlines(inst_pickup, 0.01, 100, colors=color, linestyles='dotted')
+        # Plot instantaneous element (50/50N): vertical line at instantaneous
+        # pickup (np.inf in params when the element is disabled)
+        if params is not None and params[5] < np.inf:
+            ax.vlines(params[5], 0.01, 100, colors=color, linestyles='dotted')
     
     # Formatting
     ax.set_xlabel('Current (A)', fontsize=12, fontweight='bold')
@@ -157,8 +204,7 @@ def plot_tcc_curves(relays: List,
         # Save to ./data/ directory by default if only filename provided
         if not os.path.dirname(filename):
             output_dir = "data"
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+            os.makedirs(output_dir, exist_ok=True)
             filename = os.path.join(output_dir, filename)
             
         plt.savefig(filename, dpi=300)
@@ -186,33 +232,11 @@ def generate_coordination_table(relays: List,
     --------
     pd.DataFrame - Coordination table
     """
+    trip_matrix = _trip_time_matrix(relays, np.asarray(test_currents, dtype=float), fault_type)
+    columns = _coordination_csv_columns(relays, test_currents, trip_matrix)
     
-    data = []
-    
-    for I_fault in test_currents:
-        row = {'Fault Current (A)': I_fault}
-        
-        for relay in relays:
-            trip_time = relay.calculate_trip_time(I_fault, fault_type)
-            
-            if trip_time is not None:
-                # Add CB operating time if available
-                if relay.cb:
-                    total_time = relay.cb.total_clearing_time(I_fault, fault_type)
-                    row[f"{relay.name} Relay (s)"] = f"{trip_time:.4f}"
-                    row[f"{relay.name} Total (s)"] = f"{total_time:.4f}"
-                else:
-                    row[f"{relay.name} (s)"] = f"{trip_time:.4f}"
-            else:
-                if relay.cb:
-                    row[f"{relay.name} Relay (s)"] = "No trip"
-                    row[f"{relay.name} Total (s)"] = "No trip"
-                else:
-                    row[f"{relay.name} (s)"] = "No trip"
-        
-        data.append(row)
-    
-    return pd.DataFrame(data)
+    return pd.DataFrame({key: values if key == 'Fault Current (A)' else _format_times(values)
+                         for key, values in columns.items()})
 
 
 if __name__ == "__main__":
@@ -1,11 +1,29 @@
 """
 relay_coordination setup script
 """
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional C/OpenMP trip time kernels (Cython is a build requirement in
+# pyproject.toml). Neither a missing or too old Cython nor a failed compile is
+# fatal: the package falls back to Numba or NumPy.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([
+        Extension(
+            "relay_coordination.core._curves_ext",
+            ["relay_coordination/core/_curves_ext.pyx"],
+            extra_compile_args=["-O3", "-fopenmp"],
+            extra_link_args=["-fopenmp"],
+            optional=True,
+        )
+    ])
+except Exception as e:
+    print(f"Skipping the compiled trip time kernels: {e}")
+    ext_modules = []
+
 setup(
     name="relay_coordination",
     version="1.0.5",
@@ -15,6 +33,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/relay_coordination",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -27,4 +46,7 @@ setup(
         "pandas",
         "matplotlib",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
 )